@@ -1,21 +1,29 @@
 import streamlit as st
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
-from youtube_transcript_api.formatters import SRTFormatter, WebVTTFormatter, JSONFormatter, TextFormatter
 from urllib.parse import urlparse, parse_qs
-import json # For pretty printing JSON output
 import yt_dlp
 import re
 import time
 import os
 import tempfile
 import logging
+import threading
+import zlib
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from audio_transcriber import transcribe_audio_from_file
 import isodate
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, stop_after_attempt, stop_when_event_set, wait_exponential, retry_if_exception_type
 import random
+from cachetools import TTLCache
 
 # Import the new config loader
-from config_loader import load_config, get_api_key
+from config_loader import load_config, get_api_key, get_performance_config
+from transcript_formatters import SEGMENT_FORMATTERS, format_video_header
+
+# Configure logging once at the entrypoint (no-op on reruns once handlers exist)
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 # --- Configuration Loading ---
 
@@ -31,12 +39,31 @@ if not get_api_key("groq") and not get_api_key("openai"):
 
 # --- Core Transcript Logic (adapted from your script) ---
 
+# Patterns used in per-segment loops, compiled once instead of looked up in re's cache per call
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_ISO8601_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+_SRT_BLOCK_SEPARATOR_RE = re.compile(r'\n\s*\n')
+_SRT_TIMESTAMP_RE = re.compile(r'([0-9:,]+)\s*-->\s*([0-9:,]+)')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+@contextmanager
+def timed_call(operation):
+    """Log how long an external call (yt-dlp, transcript API, Groq) took, including failures."""
+    start = time.monotonic()
+    try:
+        yield
+    except Exception:
+        logging.info("%s failed after %.2fs", operation, time.monotonic() - start)
+        raise
+    logging.info("%s took %.2fs", operation, time.monotonic() - start)
+
 def sanitize_filename(filename):
     """Sanitize a string to be used as a filename."""
     # Remove invalid characters for Windows/Unix filenames
-    filename = re.sub(r'[<>:"/\\|?*]', '', filename)
+    filename = _INVALID_FILENAME_CHARS_RE.sub('', filename)
     # Replace multiple spaces with single space
-    filename = re.sub(r'\s+', ' ', filename)
+    filename = _WHITESPACE_RE.sub(' ', filename)
     # Remove leading/trailing spaces and dots
     filename = filename.strip('. ')
     # Limit length to avoid filesystem issues
@@ -55,18 +82,18 @@ def parse_iso8601_duration(duration_str: str) -> int:
         return int(duration_obj.total_seconds())
     except (isodate.ISO8601Error, ValueError, AttributeError):
         # Fallback for simple cases if isodate fails
-        import re
-        match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration_str)
+        match = _ISO8601_DURATION_RE.match(duration_str)
         if not match:
-            logging.warning(f"Failed to parse duration: {duration_str}")
+            logging.warning("Failed to parse duration: %s", duration_str)
             return 0
         hours = int(match.group(1)) if match.group(1) else 0
         minutes = int(match.group(2)) if match.group(2) else 0
         seconds = int(match.group(3)) if match.group(3) else 0
         return hours * 3600 + minutes * 60 + seconds
 
-def get_video_info(video_id):
-    """Get video title and other info using yt-dlp."""
+@st.cache_data(ttl=3600, max_entries=1000, show_spinner=False)
+def _extract_video_info(video_id):
+    """Run yt-dlp metadata extraction for a video; results are cached per video ID for an hour."""
     video_url = f"https://www.youtube.com/watch?v={video_id}"
     
     ydl_opts = {
@@ -75,33 +102,44 @@ def get_video_info(video_id):
         'extract_flat': False,  # Get full info including title
     }
     
-    try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with timed_call("yt-dlp metadata extraction"):
             info = ydl.extract_info(video_url, download=False)
-            
-            # Check if it's a live stream
-            is_live = info.get('is_live', False)
-            live_status = info.get('live_status', 'none')  # 'is_live', 'is_upcoming', 'was_live', 'none'
-            
-            return {
-                'title': info.get('title', f'video_{video_id}'),
-                'id': video_id,
-                'url': video_url,
-                'duration': info.get('duration', 0),  # Duration in seconds
-                'is_live': is_live,
-                'live_status': live_status,
-                'was_live': live_status == 'was_live',
-                'description': info.get('description', ''),
-                'uploader': info.get('uploader', ''),
-            }
+    
+    # Check if it's a live stream
+    is_live = info.get('is_live', False)
+    live_status = info.get('live_status', 'none')  # 'is_live', 'is_upcoming', 'was_live', 'none'
+    
+    return {
+        'title': info.get('title', f'video_{video_id}'),
+        'id': video_id,
+        'url': video_url,
+        'duration': info.get('duration', 0),  # Duration in seconds
+        'is_live': is_live,
+        'live_status': live_status,
+        'was_live': live_status == 'was_live',
+        'description': info.get('description', ''),
+        'uploader': info.get('uploader', ''),
+    }
+
+def get_video_info(video_id):
+    """Get video title and other info using yt-dlp."""
+    try:
+        info = _extract_video_info(video_id)
     except Exception as e:
+        # Exceptions are not cached, so a failed lookup is retried next time
         st.warning(f"Could not fetch video info: {e}")
         return {
             'title': f'video_{video_id}',
             'id': video_id,
-            'url': video_url,
+            'url': f"https://www.youtube.com/watch?v={video_id}",
             'duration': 0
         }
+    
+    # Live and upcoming streams change state, so don't keep serving a stale entry
+    if info['live_status'] in ('is_live', 'is_upcoming'):
+        _extract_video_info.clear(video_id)
+    return info
 
 def get_video_id_from_url(youtube_url):
     """Extracts video ID from various YouTube URL formats."""
@@ -111,6 +149,11 @@ def get_video_id_from_url(youtube_url):
     # Clean the URL - remove any whitespace
     youtube_url = youtube_url.strip()
     
+    # Cheap substring probe: skip URL parsing entirely for non-YouTube input
+    # (hostnames are case-insensitive, matching urlparse's lowercased .hostname)
+    if 'youtu' not in youtube_url.lower():
+        return None
+    
     parsed_url = urlparse(youtube_url)
     
     # Handle youtu.be short URLs
@@ -138,16 +181,147 @@ def get_video_id_from_url(youtube_url):
             return parsed_url.path.split('/')[2].split('?')[0]
     return None
 
+@st.cache_resource(show_spinner=False)
+def get_transcript_api(proxy_username=None, proxy_password=None):
+    """
+    Returns a shared YouTubeTranscriptApi client so it is built once rather than per fetch.
+    The direct client keeps its connections alive across retries, reruns and sessions; the
+    Webshare client doesn't, since the library sends Connection: close to rotate proxy IPs.
+    """
+    if proxy_username and proxy_password:
+        from youtube_transcript_api.proxies import WebshareProxyConfig
+        proxy_config = WebshareProxyConfig(
+            proxy_username=proxy_username,
+            proxy_password=proxy_password,
+            retries_when_blocked=3  # Reduce retries for faster fallback
+        )
+        return YouTubeTranscriptApi(proxy_config=proxy_config)
+    return YouTubeTranscriptApi()
+
+# How often a session waiting on another session's transcription re-checks (and can be stopped)
+AI_FLIGHT_WAIT_POLL_SECONDS = 0.5
+
+@st.cache_resource(show_spinner=False)
+def get_ai_transcription_registry():
+    """
+    Process-wide state shared by every session: one lock per in-flight AI transcription and
+    the transcripts recently produced, so the same video isn't downloaded and transcribed twice.
+    """
+    # Transcripts are stored zlib-compressed (plain text shrinks ~3-4x), so a day's worth fits
+    return {
+        'guard': threading.Lock(),
+        'locks': {},
+        'transcripts': TTLCache(maxsize=256, ttl=86400),
+        'stats': {'hits': 0, 'misses': 0},
+    }
+
+@st.cache_resource(show_spinner=False)
+def get_ai_transcription_slots():
+    """
+    Process-wide cap on AI transcription jobs running at once. Each job already fans out into
+    many chunk requests, so a burst of sessions would otherwise pile up downloads, ffmpeg work
+    and temp files. Jobs over the cap wait for a slot; only a full wait queue turns them away.
+    """
+    performance_config = get_performance_config()
+    return {
+        'semaphore': threading.BoundedSemaphore(performance_config["max_concurrent_transcriptions"]),
+        'guard': threading.Lock(),
+        'waiting': 0,
+        'max_waiting': performance_config["max_queued_transcriptions"],
+    }
+
+def acquire_ai_transcription_slot(status_placeholder=None):
+    """
+    Waits for a free AI transcription slot, polling so Streamlit can still stop the session.
+    Returns False without waiting if max_queued_transcriptions sessions are already queued.
+    """
+    slots = get_ai_transcription_slots()
+    semaphore = slots['semaphore']
+    if semaphore.acquire(blocking=False):
+        return True
+    
+    with slots['guard']:
+        if slots['waiting'] >= slots['max_waiting']:
+            return False
+        slots['waiting'] += 1
+    try:
+        while not semaphore.acquire(timeout=AI_FLIGHT_WAIT_POLL_SECONDS):
+            if status_placeholder:
+                status_placeholder.info("⏳ Other AI transcriptions are running - waiting for a free slot...")
+    finally:
+        with slots['guard']:
+            slots['waiting'] -= 1
+    return True
+
+@contextmanager
+def ai_transcription_flight(flight_key, status_placeholder=None):
+    """
+    Single-flight guard keyed by (video_id, language). Yields a dict whose 'transcript'
+    holds a result another session already produced; set it before leaving to share a new one,
+    or clear 'cacheable' to keep it private. On a miss, 'admitted' says whether a transcription
+    slot was obtained to produce one.
+    """
+    registry = get_ai_transcription_registry()
+    with registry['guard']:
+        # 'users' counts holders and waiters, so the lock outlives everyone queued on it
+        entry = registry['locks'].setdefault(flight_key, {'lock': threading.Lock(), 'users': 0})
+        entry['users'] += 1
+    flight_lock = entry['lock']
+    
+    try:
+        # Poll instead of blocking outright: each placeholder update gives Streamlit a
+        # chance to raise its stop/rerun exception while this session is waiting
+        if not flight_lock.acquire(blocking=False):
+            while not flight_lock.acquire(timeout=AI_FLIGHT_WAIT_POLL_SECONDS):
+                if status_placeholder:
+                    status_placeholder.info("⏳ This video is already being transcribed in another session - waiting for that result...")
+        
+        try:
+            with registry['guard']:
+                compressed = registry['transcripts'].get(flight_key)
+                cache_hit = compressed is not None
+                stats = registry['stats']
+                stats['hits' if cache_hit else 'misses'] += 1
+                hits, misses = stats['hits'], stats['misses']
+            logging.info("Shared AI transcript cache %s for %s (hits=%d, misses=%d)",
+                         "hit" if cache_hit else "miss", flight_key, hits, misses)
+            
+            admitted = not cache_hit and acquire_ai_transcription_slot(status_placeholder)
+            flight = {
+                'transcript': zlib.decompress(compressed).decode('utf-8') if cache_hit else None,
+                'admitted': admitted,
+                'cacheable': True,
+            }
+            try:
+                yield flight
+            finally:
+                if admitted:
+                    get_ai_transcription_slots()['semaphore'].release()
+            if flight['transcript'] and flight['cacheable'] and not cache_hit:
+                compressed = zlib.compress(flight['transcript'].encode('utf-8'), 6)
+                with registry['guard']:
+                    registry['transcripts'][flight_key] = compressed
+        finally:
+            flight_lock.release()
+    finally:
+        with registry['guard']:
+            entry['users'] -= 1
+            if not entry['users']:
+                del registry['locks'][flight_key]
+
 @retry(
     retry=retry_if_exception_type(Exception),
     stop=stop_after_attempt(4),
     wait=wait_exponential(multiplier=2, min=2, max=10)
 )
-def fetch_transcript_segments(video_id):
+def fetch_transcript_segments(video_id, cancel_event=None):
     """
     Fetches transcript segments using youtube-transcript-api v1.1.0 with Webshare proxy support
     and robust retry logic with exponential backoff.
     """
+    if cancel_event is not None and cancel_event.is_set():
+        raise CancelledError(f"Transcript fetch for {video_id} was cancelled")
+    
     print(f"\n🔍 DEBUG: Attempting to fetch transcript for video_id: {video_id}")
     
     # Import the new v1.1.0 components
@@ -164,24 +338,22 @@ def fetch_transcript_segments(video_id):
         if webshare_username and webshare_password:
             try:
                 print("🔗 DEBUG: Using Webshare proxy for enhanced reliability")
-                proxy_config = WebshareProxyConfig(
-                    proxy_username=webshare_username,
-                    proxy_password=webshare_password,
-                    retries_when_blocked=3  # Reduce retries for faster fallback
-                )
-                ytt_api = YouTubeTranscriptApi(proxy_config=proxy_config)
-                transcript = ytt_api.fetch(video_id, languages=['en', 'en-US', 'en-GB'])
+                ytt_api = get_transcript_api(webshare_username, webshare_password)
+                with timed_call("Transcript fetch (Webshare proxy)"):
+                    transcript = ytt_api.fetch(video_id, languages=['en', 'en-US', 'en-GB'])
                 print("✅ DEBUG: Webshare proxy successful!")
                 
             except Exception as proxy_error:
                 print(f"⚠️ DEBUG: Webshare proxy failed ({proxy_error}), falling back to direct connection")
-                ytt_api = YouTubeTranscriptApi()
-                transcript = ytt_api.fetch(video_id, languages=['en', 'en-US', 'en-GB'])
+                ytt_api = get_transcript_api()
+                with timed_call("Transcript fetch (direct)"):
+                    transcript = ytt_api.fetch(video_id, languages=['en', 'en-US', 'en-GB'])
                 print("✅ DEBUG: Direct connection successful!")
         else:
             print("⚠️ DEBUG: No Webshare credentials found, using direct connection")
-            ytt_api = YouTubeTranscriptApi()
-            transcript = ytt_api.fetch(video_id, languages=['en', 'en-US', 'en-GB'])
+            ytt_api = get_transcript_api()
+            with timed_call("Transcript fetch (direct)"):
+                transcript = ytt_api.fetch(video_id, languages=['en', 'en-US', 'en-GB'])
             print("✅ DEBUG: Direct connection successful!")
         
         if not transcript or not transcript.snippets:
@@ -217,14 +389,22 @@ def fetch_transcript_segments(video_id):
         print(f"💥 DEBUG: An error occurred. Tenacity will handle the retry. Error: {e}")
         raise e  # Re-raise the exception for tenacity to catch.
 
+def fetch_transcript_segments_cancellable(video_id, cancel_event):
+    """
+    Runs fetch_transcript_segments for a speculative background fetch. Setting cancel_event
+    stops the retries, cutting any backoff sleep short, instead of letting them run out.
+    """
+    return fetch_transcript_segments.retry_with(
+        stop=stop_after_attempt(4) | stop_when_event_set(cancel_event),
+        sleep=cancel_event.wait
+    )(video_id, cancel_event=cancel_event)
+
 def parse_srt_to_segments(srt_text):
     """Parse SRT format text into segments compatible with existing format."""
-    import re
-    
     segments = []
     
     # Split by double newlines to get individual subtitle blocks
-    blocks = re.split(r'\n\s*\n', srt_text.strip())
+    blocks = _SRT_BLOCK_SEPARATOR_RE.split(srt_text.strip())
     
     for block in blocks:
         if not block.strip():
@@ -238,7 +418,7 @@ def parse_srt_to_segments(srt_text):
         # Parse timestamp (second line)
         timestamp_line = lines[1]
         # Format: "00:00:00,000 --> 00:00:05,000"
-        timestamp_match = re.match(r'([0-9:,]+)\s*-->\s*([0-9:,]+)', timestamp_line)
+        timestamp_match = _SRT_TIMESTAMP_RE.match(timestamp_line)
         
         if timestamp_match:
             start_time_str = timestamp_match.group(1)
@@ -252,7 +432,7 @@ def parse_srt_to_segments(srt_text):
             # Join remaining lines as text
             text = '\n'.join(lines[2:]).strip()
             # Remove HTML tags that might be in SRT
-            text = re.sub(r'<[^>]+>', '', text)
+            text = _HTML_TAG_RE.sub('', text)
             
             if text:  # Only add if there's actual text
                 segments.append({
@@ -291,106 +471,47 @@ def format_segments(segments, output_format="txt"):
     if len(segments) == 0:
         return "Segments list is empty."
 
+    formatter_entry = SEGMENT_FORMATTERS.get(output_format)
+    if formatter_entry is None:
+        return f"Unsupported format: {output_format}"
+    format_label, formatter = formatter_entry
+
     try:
         # For very long videos, show progress
-        if len(segments) > 1000:
+        show_progress = len(segments) > 1000
+        if show_progress:
             progress_bar = st.progress(0)
             status_text = st.empty()
+            status_text.text(f"Formatting as {format_label} (this may take a while)...")
+            progress_bar.progress(0.5)
             
-        # Convert segments to the format expected by the formatters
-        # The formatters expect objects with .text, .start, .duration attributes
-        # But we have dictionaries, so we need to convert them
-        
-        class TranscriptSegment:
-            def __init__(self, text, start, duration):
-                self.text = text
-                self.start = start
-                self.duration = duration
+        formatted_text = formatter(segments)
         
-        formatted_segments = []
-        for segment in segments:
-            if isinstance(segment, dict):
-                # Convert dict to object format expected by formatters
-                formatted_segment = TranscriptSegment(
-                    text=segment.get('text', ''),
-                    start=segment.get('start', 0),
-                    duration=segment.get('duration', 0)
-                )
-                formatted_segments.append(formatted_segment)
-            else:
-                # Already in object format
-                formatted_segments.append(segment)
-            
-        if output_format == "srt":
-            formatter = SRTFormatter()
-            if len(segments) > 1000:
-                status_text.text("Formatting as SRT (this may take a while)...")
-                progress_bar.progress(0.5)
-            formatted_text = formatter.format_transcript(formatted_segments)
-            if len(segments) > 1000:
-                progress_bar.progress(1.0)
-                status_text.empty()
-                progress_bar.empty()
-            return formatted_text
-            
-        elif output_format == "vtt":
-            formatter = WebVTTFormatter()
-            if len(segments) > 1000:
-                status_text.text("Formatting as WebVTT (this may take a while)...")
-                progress_bar.progress(0.5)
-            formatted_text = formatter.format_transcript(formatted_segments)
-            if len(segments) > 1000:
-                progress_bar.progress(1.0)
-                status_text.empty()
-                progress_bar.empty()
-            return formatted_text
-            
-        elif output_format == "json":
-            if len(segments) > 1000:
-                status_text.text("Formatting as JSON (this may take a while)...")
-                progress_bar.progress(0.5)
-            # For JSON, we can use the original dict format
-            formatted_text = json.dumps(segments, indent=2, ensure_ascii=False)
-            if len(segments) > 1000:
-                progress_bar.progress(1.0)
-                status_text.empty()
-                progress_bar.empty()
-            return formatted_text
-            
-        elif output_format == "txt":
-            if len(segments) > 1000:
-                status_text.text("Formatting as plain text (this may take a while)...")
-                progress_bar.progress(0.5)
-            
-            # For plain text, we can do it manually to avoid formatter issues
-            text_parts = []
-            for segment in segments:
-                if isinstance(segment, dict):
-                    text_parts.append(segment.get('text', ''))
-                else:
-                    text_parts.append(getattr(segment, 'text', ''))
-            
-            formatted_text = ' '.join(text_parts)
-            
-            if len(segments) > 1000:
-                progress_bar.progress(1.0)
-                status_text.empty()
-                progress_bar.empty()
-            return formatted_text
-        else:
-            return f"Unsupported format: {output_format}"
+        if show_progress:
+            progress_bar.progress(1.0)
+            status_text.empty()
+            progress_bar.empty()
+        return formatted_text
             
     except Exception as e:
         return f"Error formatting transcript: {str(e)}"
 
-def download_audio_as_mp3_enhanced(video_id, output_dir="video_outputs", video_title=None, progress_placeholder=None, status_placeholder=None):
+# Shared by every download strategy; yt-dlp copies postprocessor entries, so one list is safe to reuse
+MP3_POSTPROCESSORS = [{
+    'key': 'FFmpegExtractAudio',
+    'preferredcodec': 'mp3',
+    'preferredquality': '192',
+}]
+
+def download_audio_as_mp3_enhanced(video_id, output_dir="video_outputs", video_title=None, progress_placeholder=None, status_placeholder=None, video_info=None):
     """Enhanced download with multiple fallback strategies including pytube and advanced yt-dlp configurations."""
     video_url = f"https://www.youtube.com/watch?v={video_id}"
     
     os.makedirs(output_dir, exist_ok=True)
     
-    # Get video info
-    video_info = get_video_info(video_id)
+    # Get video info (reuse the caller's copy to avoid a second yt-dlp extraction)
+    if video_info is None:
+        video_info = get_video_info(video_id)
     if not video_title:
         video_title = video_info['title']
     
@@ -415,11 +536,7 @@ def download_audio_as_mp3_enhanced(video_id, output_dir="video_outputs", video_t
                 
             ydl_opts = {
                 'format': 'bestaudio[ext=m4a]/bestaudio/best',
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '192',
-                }],
+                'postprocessors': MP3_POSTPROCESSORS,
                 'outtmpl': os.path.join(output_dir, f"{safe_title}.%(ext)s"),
                 'quiet': True,
                 'no_warnings': True,
@@ -446,11 +563,7 @@ def download_audio_as_mp3_enhanced(video_id, output_dir="video_outputs", video_t
             
         ydl_opts = {
             'format': 'bestaudio[ext=m4a]/bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }],
+            'postprocessors': MP3_POSTPROCESSORS,
             'outtmpl': os.path.join(output_dir, f"{safe_title}.%(ext)s"),
             'quiet': True,
             'no_warnings': True,
@@ -495,11 +608,7 @@ def download_audio_as_mp3_enhanced(video_id, output_dir="video_outputs", video_t
             
         ydl_opts = {
             'format': 'bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }],
+            'postprocessors': MP3_POSTPROCESSORS,
             'outtmpl': os.path.join(output_dir, f"{safe_title}.%(ext)s"),
             'quiet': True,
             'no_warnings': True,
@@ -564,11 +673,7 @@ def download_audio_as_mp3_enhanced(video_id, output_dir="video_outputs", video_t
             
         ydl_opts = {
             'format': 'bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }],
+            'postprocessors': MP3_POSTPROCESSORS,
             'outtmpl': os.path.join(output_dir, f"{safe_title}.%(ext)s"),
             'quiet': True,
             'no_warnings': True,
@@ -600,7 +705,6 @@ def download_audio_as_mp3_enhanced(video_id, output_dir="video_outputs", video_t
         if status_placeholder:
             status_placeholder.text("🔄 Strategy 6: Trying moviepy extraction...")
             
-        import tempfile
         try:
             from moviepy.editor import VideoFileClip
         except ImportError:
@@ -652,14 +756,15 @@ def download_audio_as_mp3_enhanced(video_id, output_dir="video_outputs", video_t
     
     return None
 
-def download_audio_as_mp3(video_id, output_dir="video_outputs", video_title=None, progress_placeholder=None, status_placeholder=None):
+def download_audio_as_mp3(video_id, output_dir="video_outputs", video_title=None, progress_placeholder=None, status_placeholder=None, video_info=None):
     """Download the audio of a YouTube video as MP3 using yt-dlp with robust fallback strategies."""
     video_url = f"https://www.youtube.com/watch?v={video_id}"
     
     os.makedirs(output_dir, exist_ok=True)
     
-    # Get video info including live status
-    video_info = get_video_info(video_id)
+    # Get video info including live status (reuse the caller's copy when provided)
+    if video_info is None:
+        video_info = get_video_info(video_id)
     if not video_title:
         video_title = video_info['title']
     
@@ -721,11 +826,7 @@ def download_audio_as_mp3(video_id, output_dir="video_outputs", video_title=None
         """Strategy 1: Standard approach (most reliable)"""
         return {
             'format': 'bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }],
+            'postprocessors': MP3_POSTPROCESSORS,
             'outtmpl': output_template,
             'quiet': True,
             'no_warnings': True,
@@ -799,16 +900,16 @@ def download_audio_as_mp3(video_id, output_dir="video_outputs", video_title=None
             
             # Check if the mp3 file was actually created
             if os.path.exists(final_mp3_path):
-                logging.info(f"Audio successfully downloaded using {strategy_name} strategy: {final_mp3_path}")
+                logging.info("Audio successfully downloaded using %s strategy: %s", strategy_name, final_mp3_path)
                 if status_placeholder and strategy_name != "Standard":
                     status_placeholder.success(f"✅ Download successful using {strategy_name} strategy!")
                 return final_mp3_path
             else:
-                logging.warning(f"{strategy_name} strategy completed but MP3 file not found")
+                logging.warning("%s strategy completed but MP3 file not found", strategy_name)
                 continue
                 
         except Exception as e:
-            logging.warning(f"{strategy_name} strategy failed: {e}")
+            logging.warning("%s strategy failed: %s", strategy_name, e)
             
             # Check if it's a specific error we should handle
             if "403" in str(e) or "Forbidden" in str(e):
@@ -877,6 +978,8 @@ if 'video_info' not in st.session_state:
     st.session_state.video_info = None
 if 'transcript_cache' not in st.session_state:
     st.session_state.transcript_cache = {}  # Cache transcripts by video ID
+if 'formatted_cache' not in st.session_state:
+    st.session_state.formatted_cache = {'segments': None, 'outputs': {}}  # Formatted text per format for the current segments
 
 # Sidebar with troubleshooting
 with st.sidebar:
@@ -1106,6 +1209,19 @@ if unofficial_button or groq_button:
                 else:
                     print(f"🆕 DEBUG: No cached data found, fetching fresh transcript...")
                     
+                    # The transcript fetch only needs the video ID, so start it now and
+                    # let it overlap with the yt-dlp metadata lookup below
+                    transcript_future = None
+                    transcript_cancel = threading.Event()
+                    if unofficial_button:
+                        transcript_executor = ThreadPoolExecutor(
+                            max_workers=1,
+                            initializer=add_script_run_ctx,
+                            initargs=(None, get_script_run_ctx())
+                        )
+                        transcript_future = transcript_executor.submit(fetch_transcript_segments_cancellable, video_id, transcript_cancel)
+                        transcript_executor.shutdown(wait=False)
+                    
                     # Get video info first
                     print(f"📹 DEBUG: Fetching video information...")
                     with st.spinner("Fetching video information..."):
@@ -1120,12 +1236,30 @@ if unofficial_button or groq_button:
                     
                     print(f"🚀 DEBUG: Starting transcript fetch process with multi-tier fallback...")
                     
+                    # Live and upcoming streams have no transcript yet and an upcoming
+                    # stream has no audio, so skip the calls that are bound to fail
+                    live_status = st.session_state.video_info.get('live_status', 'none')
+                    
                     # Handle different methods based on button clicked
-                    if unofficial_button:
+                    if unofficial_button and live_status in ('is_live', 'is_upcoming'):
+                        # Stop the speculative fetch; it is already running, so cancel() alone wouldn't
+                        transcript_cancel.set()
+                        status_container.empty()
+                        st.session_state.error_message = "Transcripts aren't available for live or upcoming streams yet. Try again after the stream has ended."
+                        st.session_state.fetched_segments = None
+                        st.session_state.transcript_type_info = ""
+                    
+                    elif groq_button and live_status == 'is_upcoming':
+                        status_container.empty()
+                        st.session_state.error_message = "📅 This stream hasn't started yet. Please try again once it is live."
+                        st.session_state.fetched_segments = None
+                        st.session_state.transcript_type_info = ""
+                    
+                    elif unofficial_button:
                         # Try unofficial method only
                         st.info("Tier 1: Attempting to fetch public transcript...")
                         try:
-                            segments, lang, _ = fetch_transcript_segments(video_id)
+                            segments, lang, _ = transcript_future.result()
                             if segments:
                                 st.success("✅ Tier 1: Public transcript found!")
                                 st.session_state.fetched_segments = segments
@@ -1161,103 +1295,121 @@ if unofficial_button or groq_button:
                             transcription_progress = st.empty()
                         
                         try:
-                            # Stage 1: Download audio with progress tracking
-                            download_status.info("📥 Stage 1: Downloading video audio...")
-                            download_progress.progress(0)
-                            
-                            audio_path = download_audio_as_mp3_enhanced(
-                                video_id, 
-                                output_dir="video_outputs", 
-                                video_title=video_info.get('title'),
-                                progress_placeholder=download_progress,
-                                status_placeholder=download_status
-                            )
+                            audio_downloaded = True
+                            server_busy = False
+                            with ai_transcription_flight((video_id, "en"), status_placeholder=download_status) as flight:
+                                transcript = flight['transcript']
+                                if transcript:
+                                    download_status.success("♻️ Reusing the transcript another session just produced for this video")
+                                elif not flight['admitted']:
+                                    server_busy = True
+                                else:
+                                    # Stage 1: Download audio with progress tracking
+                                    download_status.info("📥 Stage 1: Downloading video audio...")
+                                    download_progress.progress(0)
+                                    
+                                    with timed_call("Audio download"):
+                                        audio_path = download_audio_as_mp3_enhanced(
+                                            video_id, 
+                                            output_dir="video_outputs", 
+                                            video_title=video_info.get('title'),
+                                            progress_placeholder=download_progress,
+                                            status_placeholder=download_status,
+                                            video_info=video_info
+                                        )
+                                    
+                                    if audio_path and os.path.exists(audio_path):
+                                        logging.info("Audio downloaded successfully: %s", audio_path)
+                                        
+                                        # Show completion of download stage
+                                        download_status.success("✅ Audio download complete!")
+                                        download_progress.progress(1.0)
+                                        
+                                        # Small pause for visual feedback
+                                        time.sleep(0.5)
+                                        
+                                        # Stage 2: Transcription
+                                        transcription_status.info("🎯 Stage 2: Starting AI transcription...")
+                                        transcription_progress.progress(0)
+                                        
+                                        # Create progress callback
+                                        def update_transcription_progress(stage, progress, message):
+                                            """Update UI based on transcription stage"""
+                                            if stage == "preprocessing":
+                                                # Map preprocessing to 0-20% of transcription progress
+                                                transcription_progress.progress(progress * 0.2)
+                                                transcription_status.info(f"🎯 Stage 2: {message}")
+                                            elif stage == "chunking":
+                                                # Map chunking to 20-30% of transcription progress
+                                                transcription_progress.progress(0.2 + progress * 0.1)
+                                                transcription_status.info(f"🎯 Stage 2: {message}")
+                                            elif stage == "transcribing":
+                                                # Map actual transcription to 30-100% of transcription progress
+                                                transcription_progress.progress(0.3 + progress * 0.7)
+                                                transcription_status.info(f"🎯 Stage 2: {message}")
+                                        
+                                        # Transcribe audio using the new optimized function
+                                        with timed_call("Groq AI transcription"):
+                                            transcript = transcribe_audio_from_file(audio_path, language="en", 
+                                                                                  progress_callback=update_transcription_progress)
+                                        
+                                        # Clean up audio file
+                                        try:
+                                            os.remove(audio_path)
+                                            logging.info("Cleaned up temporary audio file: %s", audio_path)
+                                        except Exception as cleanup_error:
+                                            logging.warning("Failed to clean up audio file: %s", cleanup_error)
+                                        
+                                        # Publish to any sessions waiting on this video. A live stream
+                                        # only yields a partial snapshot, so don't share that one
+                                        flight['transcript'] = transcript
+                                        flight['cacheable'] = video_info.get('live_status') not in ('is_live', 'is_upcoming')
+                                    else:
+                                        audio_downloaded = False
                             
-                            if audio_path and os.path.exists(audio_path):
-                                logging.info(f"Audio downloaded successfully: {audio_path}")
-                                
-                                # Show completion of download stage
-                                download_status.success("✅ Audio download complete!")
-                                download_progress.progress(1.0)
-                                
-                                # Small pause for visual feedback
-                                time.sleep(0.5)
+                            if server_busy:
+                                download_status.warning("🚦 The server is busy with other AI transcriptions. Please try again in a few minutes.")
+                                st.session_state.error_message = "Too many AI transcriptions in progress, please try again shortly"
+                                st.session_state.fetched_segments = None
+                                st.session_state.transcript_type_info = ""
+                            elif not audio_downloaded:
+                                download_status.error("❌ Audio download failed")
+                                st.session_state.error_message = "Could not download audio"
+                                st.session_state.fetched_segments = None
+                                st.session_state.transcript_type_info = ""
+                            elif transcript:
+                                # Complete the progress
+                                transcription_progress.progress(1.0)
+                                transcription_status.success("✅ Transcription complete!")
                                 
-                                # Stage 2: Transcription
-                                transcription_status.info("🎯 Stage 2: Starting AI transcription...")
-                                transcription_progress.progress(0)
+                                # Add video title and URL to the transcript
+                                video_url = f"https://www.youtube.com/watch?v={video_id}"
+                                video_title = video_info.get('title', f'video_{video_id}')
                                 
-                                # Create progress callback
-                                def update_transcription_progress(stage, progress, message):
-                                    """Update UI based on transcription stage"""
-                                    if stage == "preprocessing":
-                                        # Map preprocessing to 0-20% of transcription progress
-                                        transcription_progress.progress(progress * 0.2)
-                                        transcription_status.info(f"🎯 Stage 2: {message}")
-                                    elif stage == "chunking":
-                                        # Map chunking to 20-30% of transcription progress
-                                        transcription_progress.progress(0.2 + progress * 0.1)
-                                        transcription_status.info(f"🎯 Stage 2: {message}")
-                                    elif stage == "transcribing":
-                                        # Map actual transcription to 30-100% of transcription progress
-                                        transcription_progress.progress(0.3 + progress * 0.7)
-                                        transcription_status.info(f"🎯 Stage 2: {message}")
+                                # Prepend video info to transcript
+                                full_transcript = format_video_header(video_title, video_url, video_id) + transcript
                                 
-                                # Transcribe audio using the new optimized function with speed adjustment
-                                speed_mult = st.session_state.get('speed_multiplier', 2.0)
-                                transcript = transcribe_audio_from_file(audio_path, language="en", 
-                                                                      progress_callback=update_transcription_progress,
-                                                                      speed_multiplier=speed_mult)
+                                # Clear the progress indicators after a short delay
+                                time.sleep(1)
+                                download_status.empty()
+                                download_progress.empty()
+                                transcription_status.empty()
+                                transcription_progress.empty()
                                 
-                                # Clean up audio file
-                                try:
-                                    os.remove(audio_path)
-                                    logging.info(f"Cleaned up temporary audio file: {audio_path}")
-                                except Exception as cleanup_error:
-                                    logging.warning(f"Failed to clean up audio file: {cleanup_error}")
+                                st.success("✅ Groq AI transcription succeeded!")
+                                st.session_state.fetched_segments = [{"text": full_transcript, "start": 0, "duration": 0}]
+                                st.session_state.transcript_type_info = "Fetched using: Groq Dev Tier AI Transcription"
+                                st.session_state.error_message = None
                                 
-                                if transcript:
-                                    # Complete the progress
-                                    transcription_progress.progress(1.0)
-                                    transcription_status.success("✅ Transcription complete!")
-                                    
-                                    # Add video title and URL to the transcript
-                                    video_url = f"https://www.youtube.com/watch?v={video_id}"
-                                    video_title = video_info.get('title', f'video_{video_id}')
-                                    
-                                    # Prepend video info to transcript
-                                    full_transcript = f"Video Title: {video_title}\n"
-                                    full_transcript += f"YouTube URL: {video_url}\n"
-                                    full_transcript += f"Video ID: {video_id}\n"
-                                    full_transcript += "-" * 80 + "\n\n"
-                                    full_transcript += transcript
-                                    
-                                    # Clear the progress indicators after a short delay
-                                    time.sleep(1)
-                                    download_status.empty()
-                                    download_progress.empty()
-                                    transcription_status.empty()
-                                    transcription_progress.empty()
-                                    
-                                    st.success("✅ Groq AI transcription succeeded!")
-                                    st.session_state.fetched_segments = [{"text": full_transcript, "start": 0, "duration": 0}]
-                                    st.session_state.transcript_type_info = "Fetched using: Groq Dev Tier AI Transcription"
-                                    st.session_state.error_message = None
-                                    
-                                    # Cache the result
-                                    st.session_state.transcript_cache[video_id] = {
-                                        'segments': st.session_state.fetched_segments,
-                                        'info': "Fetched using: Groq Dev Tier AI Transcription",
-                                        'video_info': st.session_state.video_info
-                                    }
-                                else:
-                                    transcription_status.error("❌ Groq AI transcription produced empty results")
-                                    st.session_state.error_message = "Groq transcription failed"
-                                    st.session_state.fetched_segments = None
-                                    st.session_state.transcript_type_info = ""
+                                # Cache the result
+                                st.session_state.transcript_cache[video_id] = {
+                                    'segments': st.session_state.fetched_segments,
+                                    'info': "Fetched using: Groq Dev Tier AI Transcription",
+                                    'video_info': st.session_state.video_info
+                                }
                             else:
-                                download_status.error("❌ Audio download failed")
-                                st.session_state.error_message = "Could not download audio"
+                                transcription_status.error("❌ Groq AI transcription produced empty results")
+                                st.session_state.error_message = "Groq transcription failed"
                                 st.session_state.fetched_segments = None
                                 st.session_state.transcript_type_info = ""
                                 
@@ -1354,9 +1506,17 @@ if st.session_state.fetched_segments:
     # Update session state with the new selection
     st.session_state.selected_format = selected_format
 
-    # Format and display the transcript based on selected format
-    with st.spinner(f"Formatting transcript as {selected_format.upper()}..."):
-        formatted_transcript_text = format_segments(st.session_state.fetched_segments, selected_format)
+    # Format and display the transcript based on selected format. Every widget interaction
+    # reruns this block, so keep each format's output for as long as the segments list is unchanged.
+    formatted_cache = st.session_state.formatted_cache
+    if formatted_cache['segments'] is not st.session_state.fetched_segments:
+        formatted_cache['segments'] = st.session_state.fetched_segments
+        formatted_cache['outputs'] = {}
+    formatted_transcript_text = formatted_cache['outputs'].get(selected_format)
+    if formatted_transcript_text is None:
+        with st.spinner(f"Formatting transcript as {selected_format.upper()}..."):
+            formatted_transcript_text = format_segments(st.session_state.fetched_segments, selected_format)
+        formatted_cache['outputs'][selected_format] = formatted_transcript_text
     
     # Check if formatting was successful
     if formatted_transcript_text.startswith("Error formatting transcript") or formatted_transcript_text == "No segments to format.":
@@ -1394,10 +1554,9 @@ if st.session_state.fetched_segments:
         if selected_format in ["txt", "srt", "vtt"] and st.session_state.video_info:
             # Check if the transcript already starts with video info (from AI transcription)
             if not formatted_transcript_text.startswith("Video Title:"):
-                header = f"Video Title: {st.session_state.video_info['title']}\n"
-                header += f"YouTube URL: {st.session_state.video_info['url']}\n"
-                header += f"Video ID: {st.session_state.video_id}\n"
-                header += "-" * 80 + "\n\n"
+                header = format_video_header(st.session_state.video_info['title'],
+                                             st.session_state.video_info['url'],
+                                             st.session_state.video_id)
                 download_content = header + formatted_transcript_text
         
         st.download_button(
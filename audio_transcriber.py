@@ -19,8 +19,7 @@ import random  # Add this import
 # Import the new config loader
 from config_loader import load_config, get_api_key, get_performance_config, get_model_config
 
-# Initialize logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+# Initialize logging (handlers are configured by the entrypoint, see __main__ below)
 logger = logging.getLogger(__name__)
 
 # Load performance configuration
@@ -77,6 +76,15 @@ def initialize_clients():
 # Initialize global clients
 groq_client, openai_client = initialize_clients()
 
+def _best_effort_remove(path: str) -> None:
+    """Delete a temporary file with a single unlink, tolerating it already being gone."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("Could not remove temporary file %s: %s", path, e)
+
 # NEW: Calculate optimal workers based on file size
 def calculate_workers_for_file_size(duration_seconds: int, rpm_limit: int) -> int:
     """
@@ -101,12 +109,12 @@ class StrictRateLimiter:
         # For large files, be more conservative
         self.safety_factor = 0.5 if conservative else 0.8
         self.effective_rpm = int(rpm * self.safety_factor)
-        logger.info(f"Rate limiter initialized: {self.effective_rpm} effective RPM (base: {rpm})")
+        logger.info("Rate limiter initialized: %s effective RPM (base: %s)", self.effective_rpm, rpm)
         
     def wait_if_needed(self):
         """Strict rate limiting without burst allowance"""
         with self.lock:
-            now = time.time()
+            now = time.monotonic()
             # Remove requests older than 1 minute
             self.requests = [t for t in self.requests if now - t < 60]
             
@@ -115,7 +123,7 @@ class StrictRateLimiter:
                 oldest_request = self.requests[0]
                 wait_time = 60.0 - (now - oldest_request) + 0.1  # Small buffer
                 if wait_time > 0:
-                    logger.debug(f"Rate limit wait: {wait_time:.2f}s")
+                    logger.debug("Rate limit wait: %.2fs", wait_time)
                     time.sleep(wait_time)
                     return self.wait_if_needed()
                     
@@ -164,7 +172,7 @@ def calculate_optimal_chunk_duration(file_duration_seconds: int, max_file_size_m
     if file_duration_seconds <= 180:  # 3 minutes or less
         estimated_size_mb = (file_duration_seconds * 16000 * 2 * 0.55) / (1024 * 1024)
         if estimated_size_mb < max_file_size_mb:
-            logger.info(f"🎯 Short video ({file_duration_seconds}s) - processing in ONE chunk!")
+            logger.info("🎯 Short video (%ss) - processing in ONE chunk!", file_duration_seconds)
             return file_duration_seconds  
     
     # SHORT VIDEOS (3-10 minutes) 
@@ -227,20 +235,20 @@ def preprocess_audio_ultrafast(input_file: str, output_file: Optional[str] = Non
             output_file
         ]
         
-        start_time = time.time()
+        start_time = time.monotonic()
         process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
         
         if process.returncode != 0:
-            logger.error(f"FFmpeg error: {process.stderr}")
+            logger.error("FFmpeg error: %s", process.stderr)
             return None
             
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
         file_size = os.path.getsize(output_file) / (1024 * 1024)
-        logger.info(f"Preprocessed in {elapsed:.2f}s → {output_file} ({file_size:.1f} MB)")
+        logger.info("Preprocessed in %.2fs → %s (%.1f MB)", elapsed, output_file, file_size)
         return output_file
         
     except Exception as e:
-        logger.error(f"Preprocessing error: {e}")
+        logger.error("Preprocessing error: %s", e)
         return None
 
 def split_audio_ultrafast(file_path: str, chunk_duration_seconds: int, 
@@ -278,7 +286,7 @@ def split_audio_ultrafast(file_path: str, chunk_duration_seconds: int,
             start_seconds += chunk_duration_seconds - overlap_seconds
             chunk_index += 1
         
-        logger.info(f"Splitting into {len(chunk_positions)} chunks of ~{chunk_duration_seconds}s each")
+        logger.info("Splitting into %s chunks of ~%ss each", len(chunk_positions), chunk_duration_seconds)
         
         # Create chunks in parallel using threading
         def create_chunk(pos):
@@ -300,13 +308,13 @@ def split_audio_ultrafast(file_path: str, chunk_duration_seconds: int,
                 chunk_path
             ]
             
-            start_time = time.time()
+            start_time = time.monotonic()
             process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
             
             if process.returncode == 0:
                 size_mb = os.path.getsize(chunk_path) / (1024 * 1024)
-                elapsed = time.time() - start_time
-                logger.debug(f"Chunk {pos['index']} created in {elapsed:.2f}s ({size_mb:.1f} MB)")
+                elapsed = time.monotonic() - start_time
+                logger.debug("Chunk %s created in %.2fs (%.1f MB)", pos['index'], elapsed, size_mb)
                 
                 return {
                     "path": chunk_path,
@@ -317,7 +325,7 @@ def split_audio_ultrafast(file_path: str, chunk_duration_seconds: int,
                     "index": pos['index']
                 }
             else:
-                logger.error(f"Failed to create chunk {pos['index']}")
+                logger.error("Failed to create chunk %s", pos['index'])
                 return None
         
         # Process chunks in parallel
@@ -334,7 +342,7 @@ def split_audio_ultrafast(file_path: str, chunk_duration_seconds: int,
         return chunks
         
     except Exception as e:
-        logger.error(f"Error splitting audio: {e}")
+        logger.error("Error splitting audio: %s", e)
         return []
 
 # IMPROVED: Transcribe chunk with better error handling
@@ -357,7 +365,7 @@ def transcribe_chunk_ultrafast(chunk_info: Dict, language: str = "en",
             rate_limiter.wait_if_needed()
         
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             
             with open(chunk_info["path"], "rb") as audio_file:
                 transcription = groq_client.audio.transcriptions.create(
@@ -369,17 +377,14 @@ def transcribe_chunk_ultrafast(chunk_info: Dict, language: str = "en",
                     temperature=0.0,
                 )
             
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             audio_duration = chunk_info["duration_ms"] / 1000
             speed_factor = audio_duration / elapsed if elapsed > 0 else 0
             
-            logger.info(f"Chunk {chunk_info['index']}: {elapsed:.2f}s ({speed_factor:.0f}x realtime)")
+            logger.info("Chunk %s: %.2fs (%.0fx realtime)", chunk_info['index'], elapsed, speed_factor)
             
             # Immediate cleanup on success
-            try:
-                os.remove(chunk_info["path"])
-            except:
-                pass
+            _best_effort_remove(chunk_info["path"])
                 
             return chunk_info["index"], transcription
             
@@ -392,8 +397,8 @@ def transcribe_chunk_ultrafast(chunk_info: Dict, language: str = "en",
                 wait_time = min(base_delay * (2 ** attempt) + random.uniform(0, 5), max_delay)
                 
                 if attempt < max_retries - 1:
-                    logger.warning(f"Chunk {chunk_info['index']} got 503 (attempt {attempt + 1}), "
-                                 f"waiting {wait_time:.1f}s...")
+                    logger.warning("Chunk %s got 503 (attempt %s), waiting %.1fs...",
+                                   chunk_info['index'], attempt + 1, wait_time)
                     time.sleep(wait_time)
                     
                     # After multiple 503s, add cooldown
@@ -401,17 +406,14 @@ def transcribe_chunk_ultrafast(chunk_info: Dict, language: str = "en",
                         logger.info("Adding cooldown period after multiple 503s...")
                         time.sleep(30)  
                 else:
-                    logger.error(f"Chunk {chunk_info['index']} failed after {max_retries} retries: {e}")
+                    logger.error("Chunk %s failed after %s retries: %s", chunk_info['index'], max_retries, e)
             else:
-                logger.error(f"Chunk {chunk_info['index']} error: {e}")
+                logger.error("Chunk %s error: %s", chunk_info['index'], e)
                 if attempt < max_retries - 1:
                     time.sleep(base_delay)
                 
         # Cleanup on final failure
-        try:
-            os.remove(chunk_info["path"])
-        except:
-            pass
+        _best_effort_remove(chunk_info["path"])
             
     return chunk_info["index"], None
 
@@ -420,7 +422,7 @@ def transcribe_audio_ultrafast(file_path: str, language: str = "en", fast_mode:
     Ultra-fast audio transcription optimized for Groq dev tier with improved large file handling.
     """
     try:
-        total_start = time.time()
+        total_start = time.monotonic()
         
         # Preprocess audio
         logger.info("⚡ Preprocessing audio...")
@@ -435,13 +437,13 @@ def transcribe_audio_ultrafast(file_path: str, language: str = "en", fast_mode:
         # Select optimal model based on file size
         model, rpm_limit = select_optimal_model(duration_seconds, language)
         
-        logger.info(f"🚀 Starting transcription with {model}")
-        logger.info(f"   Rate limit: {rpm_limit} RPM, Fast mode: {fast_mode}")
+        logger.info("🚀 Starting transcription with %s", model)
+        logger.info("   Rate limit: %s RPM, Fast mode: %s", rpm_limit, fast_mode)
         
         # Special handling for MASSIVE videos
         if duration_seconds > 14400:  # Over 4 hours
             hours = duration_seconds / 3600
-            logger.warning(f"⚠️  MASSIVE VIDEO DETECTED: {hours:.1f} hours!")
+            logger.warning("⚠️  MASSIVE VIDEO DETECTED: %.1f hours!", hours)
             logger.info("   Using conservative settings to avoid service errors...")
             logger.info("   This may take some time, but it will complete!")
         
@@ -450,7 +452,7 @@ def transcribe_audio_ultrafast(file_path: str, language: str = "en", fast_mode:
         
         # Check if we should process in one chunk 
         if optimal_chunk_duration >= duration_seconds:
-            logger.info(f"⚡ Processing entire {duration_seconds}s video in ONE request!")
+            logger.info("⚡ Processing entire %ss video in ONE request!", duration_seconds)
             
             # Create rate limiter
             rate_limiter = StrictRateLimiter(rpm_limit, conservative=False)
@@ -472,33 +474,33 @@ def transcribe_audio_ultrafast(file_path: str, language: str = "en", fast_mode:
                 logger.error("Failed to transcribe audio")
                 return None
                 
-            total_time = time.time() - total_start
+            total_time = time.monotonic() - total_start
             speed_factor = duration_seconds / total_time if total_time > 0 else 0
             
             logger.info("=" * 60)
             logger.info("🏁 TRANSCRIPTION COMPLETE - SINGLE CHUNK MODE")
             logger.info("=" * 60)
-            logger.info(f"📝 Audio duration: {duration_seconds}s ({duration_seconds/60:.1f} min)")
-            logger.info(f"⚡ Total time: {total_time:.2f}s")
-            logger.info(f"🚀 Speed: {speed_factor:.1f}x realtime")
+            logger.info("📝 Audio duration: %ss (%.1f min)", duration_seconds, duration_seconds/60)
+            logger.info("⚡ Total time: %.2fs", total_time)
+            logger.info("🚀 Speed: %.1fx realtime", speed_factor)
             logger.info("=" * 60)
             
             return transcription
         
         # For longer videos, continue with chunking strategy
-        logger.info(f"📊 Audio: {duration_seconds}s, Chunk size: {optimal_chunk_duration}s")
+        logger.info("📊 Audio: %ss, Chunk size: %ss", duration_seconds, optimal_chunk_duration)
         
         # Split audio
-        split_start = time.time()
+        split_start = time.monotonic()
         overlap = 0.5 if fast_mode else 1.0  
         chunks = split_audio_ultrafast(preprocessed_file, optimal_chunk_duration, overlap)
-        split_time = time.time() - split_start
+        split_time = time.monotonic() - split_start
         
-        logger.info(f"✂️  Split into {len(chunks)} chunks in {split_time:.2f}s")
+        logger.info("✂️  Split into %s chunks in %.2fs", len(chunks), split_time)
         
         # Cleanup preprocessed file early
-        if preprocessed_file != file_path and os.path.exists(preprocessed_file):
-            os.remove(preprocessed_file)
+        if preprocessed_file != file_path:
+            _best_effort_remove(preprocessed_file)
         
         # Create rate limiter - be conservative for large files
         conservative = duration_seconds > 7200  # 2+ hours
@@ -507,10 +509,10 @@ def transcribe_audio_ultrafast(file_path: str, language: str = "en", fast_mode:
         # Calculate optimal workers - CONSERVATIVE FOR LARGE FILES
         optimal_workers = calculate_workers_for_file_size(duration_seconds, rpm_limit)
         
-        logger.info(f"🔥 Transcribing with {optimal_workers} parallel workers...")
+        logger.info("🔥 Transcribing with %s parallel workers...", optimal_workers)
         
         # PARALLEL TRANSCRIPTION WITH BETTER ERROR HANDLING
-        transcription_start = time.time()
+        transcription_start = time.monotonic()
         transcriptions = {}
         failed_chunks = []
         
@@ -537,25 +539,25 @@ def transcribe_audio_ultrafast(file_path: str, language: str = "en", fast_mode:
                     transcriptions[chunk_index] = transcription
                 else:
                     failed_chunks.append(chunk_index)
-                    logger.warning(f"Failed chunk: {chunk_index}")
+                    logger.warning("Failed chunk: %s", chunk_index)
                     
                 # Progress update 
                 progress = completed / len(chunks) * 100
                 if completed % max(1, len(chunks) // 4) == 0:
-                    elapsed = time.time() - transcription_start
+                    elapsed = time.monotonic() - transcription_start
                     eta = (elapsed / completed) * (len(chunks) - completed)
-                    logger.info(f"   Progress: {progress:.0f}% ({completed}/{len(chunks)}) ETA: {eta:.1f}s")
+                    logger.info("   Progress: %.0f%% (%s/%s) ETA: %.1fs", progress, completed, len(chunks), eta)
                     
                     # Add cooldown if high failure rate
                     if len(failed_chunks) > len(chunks) * 0.1:  # >10% failure
                         logger.warning("High failure rate detected, adding cooldown...")
                         time.sleep(30)
         
-        transcription_time = time.time() - transcription_start
+        transcription_time = time.monotonic() - transcription_start
         
         # Retry failed chunks with even more conservative settings
         if failed_chunks:
-            logger.warning(f"Retrying {len(failed_chunks)} failed chunks...")
+            logger.warning("Retrying %s failed chunks...", len(failed_chunks))
             time.sleep(60)  # Wait 1 minute before retrying
             
             # Retry with only 1 worker and longer delays
@@ -575,7 +577,7 @@ def transcribe_audio_ultrafast(file_path: str, language: str = "en", fast_mode:
         ).strip()
         
         # Calculate performance metrics
-        total_time = time.time() - total_start
+        total_time = time.monotonic() - total_start
         actual_speed_factor = duration_seconds / total_time if total_time > 0 else 0
         transcription_speed = duration_seconds / transcription_time if transcription_time > 0 else 0
         success_rate = len(transcriptions) / len(chunks) * 100
@@ -584,19 +586,19 @@ def transcribe_audio_ultrafast(file_path: str, language: str = "en", fast_mode:
         logger.info("=" * 60)
         logger.info("🏁 TRANSCRIPTION COMPLETE - PERFORMANCE REPORT")
         logger.info("=" * 60)
-        logger.info(f"📝 Audio duration: {duration_seconds:,} seconds ({duration_seconds/60:.1f} minutes)")
-        logger.info(f"⚡ Total time: {total_time:.2f} seconds")
-        logger.info(f"🚀 Transcription time: {transcription_time:.2f} seconds")
-        logger.info(f"📊 Preprocessing time: {split_time:.2f} seconds")
-        logger.info(f"🔥 Overall speed: {actual_speed_factor:.1f}x realtime")
-        logger.info(f"💨 Transcription speed: {transcription_speed:.1f}x realtime")
-        logger.info(f"✅ Success rate: {success_rate:.1f}% ({len(transcriptions)}/{len(chunks)} chunks)")
+        logger.info("📝 Audio duration: %s seconds (%.1f minutes)", format(duration_seconds, ","), duration_seconds/60)
+        logger.info("⚡ Total time: %.2f seconds", total_time)
+        logger.info("🚀 Transcription time: %.2f seconds", transcription_time)
+        logger.info("📊 Preprocessing time: %.2f seconds", split_time)
+        logger.info("🔥 Overall speed: %.1fx realtime", actual_speed_factor)
+        logger.info("💨 Transcription speed: %.1fx realtime", transcription_speed)
+        logger.info("✅ Success rate: %.1f%% (%s/%s chunks)", success_rate, len(transcriptions), len(chunks))
         logger.info("=" * 60)
         
         return full_transcription
         
     except Exception as e:
-        logger.error(f"Transcription failed: {e}")
+        logger.error("Transcription failed: %s", e)
         return None
 
 # Backward compatible function
@@ -635,17 +637,18 @@ def benchmark_transcription(file_path: str):
         CHUNK_DURATION_SECONDS = config["chunks"]
         MAX_CONCURRENT_REQUESTS = config["workers"]
         
-        logger.info(f"\nTesting: {config['chunks']}s chunks, {config['workers']} workers")
-        start = time.time()
+        logger.info("\nTesting: %ss chunks, %s workers", config['chunks'], config['workers'])
+        start = time.monotonic()
         result = transcribe_audio_ultrafast(file_path)
-        elapsed = time.time() - start
+        elapsed = time.monotonic() - start
         
         if result:
-            logger.info(f"   Time: {elapsed:.2f}s")
-            logger.info(f"   Words: {len(result.split())}")
+            logger.info("   Time: %.2fs", elapsed)
+            logger.info("   Words: %s", len(result.split()))
 
 if __name__ == "__main__":
     import sys
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
     if len(sys.argv) > 2 and sys.argv[1] == "benchmark":
         benchmark_transcription(sys.argv[2])
     elif len(sys.argv) > 1:
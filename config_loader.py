@@ -48,19 +48,19 @@ def load_config():
         # Streamlit not installed or not running in Streamlit
         pass
     except Exception as e:
-        logger.warning(f"Failed to load Streamlit secrets: {e}")
+        logger.warning("Failed to load Streamlit secrets: %s", e)
     
     # Fall back to local config.yaml
     config_path = os.path.join(os.path.dirname(__file__), "config.yaml")
     
     if os.path.exists(config_path):
-        logger.info(f"Loading config from {config_path}")
+        logger.info("Loading config from %s", config_path)
         try:
             with open(config_path, 'r') as f:
                 config = yaml.safe_load(f)
                 return config if config else {}
         except Exception as e:
-            logger.error(f"Failed to load config.yaml: {e}")
+            logger.error("Failed to load config.yaml: %s", e)
             return {}
     else:
         logger.warning("No config.yaml found and not running on Streamlit Cloud")
@@ -89,7 +89,7 @@ def get_api_key(provider: str) -> str:
     if env_key in os.environ:
         return os.environ[env_key]
     
-    logger.warning(f"No API key found for {provider}")
+    logger.warning("No API key found for %s", provider)
     return ""
 
 
@@ -130,6 +130,8 @@ def get_performance_config() -> dict:
     
     defaults = {
         "max_concurrent_requests": 50,
+        "max_concurrent_transcriptions": 2,  # Whole AI transcription jobs per server process
+        "max_queued_transcriptions": 64,  # Sessions allowed to wait for a free job slot
         "circuit_breaker_threshold": 3,
         "http2_enabled": True,
         "rate_limit_safety_factor": 0.8,
@@ -94,7 +94,7 @@ class CircuitBreaker:
         
     def can_execute(self) -> bool:
         """Check if request can be executed"""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         if self.state == CircuitState.CLOSED:
             return True
@@ -126,7 +126,7 @@ class CircuitBreaker:
     
     def record_failure(self, error: Exception) -> None:
         """Record failed request"""
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
         self.failure_count += 1
         
         # Check if should open circuit (for 503 errors or too many failures)
@@ -145,7 +145,7 @@ class CircuitBreaker:
             )
             logger.warning(
                 f"Circuit breaker OPENED after {self.failure_count} failures. "
-                f"Next attempt at {time.ctime(self.next_attempt_time)}"
+                f"Next attempt in {self.config.recovery_timeout:.0f}s"
             )
 
 
@@ -160,7 +160,7 @@ class RequestTracker:
         
     def _cleanup_expired(self) -> None:
         """Remove expired request tracking"""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Clean up history
         while (self.request_history and 
@@ -182,7 +182,7 @@ class RequestTracker:
     
     def track_request(self, request_id: str) -> None:
         """Start tracking a request"""
-        current_time = time.time()
+        current_time = time.monotonic()
         self.active_requests.add(request_id)
         self.request_history.append((request_id, current_time))
         self.request_times[request_id] = current_time
@@ -262,7 +262,7 @@ class AdvancedRateLimiter:
     
     def _should_wait_for_rate_limit(self) -> Tuple[bool, float]:
         """Check if should wait for rate limiting"""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Remove old requests
         while (self.request_times and 
@@ -280,7 +280,7 @@ class AdvancedRateLimiter:
     
     def _should_wait_for_cooldown(self) -> Tuple[bool, float]:
         """Check if in cooldown period"""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         if current_time < self.cooldown_until:
             return True, self.cooldown_until - current_time
@@ -295,7 +295,7 @@ class AdvancedRateLimiter:
     
     def _record_request_start(self) -> None:
         """Record request start for rate limiting"""
-        current_time = time.time()
+        current_time = time.monotonic()
         self.request_times.append(current_time)
         self.metrics.total_requests += 1
     
@@ -312,13 +312,13 @@ class AdvancedRateLimiter:
         self.metrics.failed_requests += 1
         self.circuit_breaker.record_failure(error)
         self.consecutive_failures += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
         
         # Set cooldown for repeated failures
         if self.consecutive_failures >= 3:
             cooldown_delay = self._calculate_backoff(self.consecutive_failures - 3)
-            self.cooldown_until = time.time() + cooldown_delay
-            logger.warning(f"Multiple failures detected, cooldown until {time.ctime(self.cooldown_until)}")
+            self.cooldown_until = time.monotonic() + cooldown_delay
+            logger.warning(f"Multiple failures detected, cooling down for {cooldown_delay:.1f}s")
     
     @asynccontextmanager
     async def rate_limited_request(self, **request_kwargs):
@@ -353,12 +353,12 @@ class AdvancedRateLimiter:
         self.request_tracker.track_request(request_id)
         self._record_request_start()
         
-        start_time = time.time()
+        start_time = time.monotonic()
         try:
             yield await self._get_client()
             
             # Record success
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             self._record_request_success(response_time)
             
         except Exception as e:
@@ -385,7 +385,7 @@ class AdvancedRateLimiter:
             "average_response_time": self.metrics.average_response_time,
             "circuit_state": self.circuit_breaker.state.value,
             "consecutive_failures": self.consecutive_failures,
-            "cooldown_active": time.time() < self.cooldown_until,
+            "cooldown_active": time.monotonic() < self.cooldown_until,
             "effective_rpm": self.effective_rpm,
             "current_request_count": len(self.request_times)
         }
@@ -452,7 +452,7 @@ class SyncRateLimiter:
         
     def wait_if_needed(self) -> None:
         """Synchronous rate limiting for backward compatibility"""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Check cooldown
         if current_time < self.cooldown_until:
@@ -473,7 +473,7 @@ class SyncRateLimiter:
                 logger.debug(f"Rate limit wait: {wait_time:.2f}s")
                 time.sleep(wait_time)
         
-        self.request_times.append(time.time())
+        self.request_times.append(time.monotonic())
     
     def record_failure(self) -> None:
         """Record failure for cooldown calculation"""
@@ -483,7 +483,7 @@ class SyncRateLimiter:
                 self.config.base_backoff * (2 ** (self.consecutive_failures - 3)),
                 self.config.max_backoff
             )
-            self.cooldown_until = time.time() + cooldown_delay
+            self.cooldown_until = time.monotonic() + cooldown_delay
             logger.warning(f"Setting cooldown: {cooldown_delay:.1f}s")
     
     def record_success(self) -> None:
@@ -61,11 +61,13 @@ class ConnectionHealthMonitor:
                 "failures": 0,
                 "total_time": 0.0,
                 "last_used": 0.0,
-                "reuse_count": 0
+                "reuse_count": 0,
+                "_last_used_monotonic": 0.0
             }
         
         self.connection_stats[host]["attempts"] += 1
-        self.connection_stats[host]["last_used"] = time.time()
+        self.connection_stats[host]["last_used"] = time.time()  # Wall-clock stamp for reporting
+        self.connection_stats[host]["_last_used_monotonic"] = time.monotonic()
     
     def record_connection_success(self, host: str, connection_time: float) -> None:
         """Record successful connection"""
@@ -104,6 +106,7 @@ class ConnectionHealthMonitor:
             return {}
         
         stats = self.connection_stats[host].copy()
+        last_used_monotonic = stats.pop("_last_used_monotonic")
         
         # Calculate derived metrics
         if stats["attempts"] > 0:
@@ -116,7 +119,7 @@ class ConnectionHealthMonitor:
         else:
             stats["average_connection_time"] = 0.0
         
-        stats["idle_time"] = time.time() - stats["last_used"]
+        stats["idle_time"] = time.monotonic() - last_used_monotonic
         
         return stats
     
@@ -230,7 +233,7 @@ class OptimizedConnectionPool:
                 [c for c in pool_info._connections if c.is_connection_dropped()]
             )
         
-        self.monitor.pool_stats["last_health_check"] = time.time()
+        self.monitor.pool_stats["last_health_check"] = time.time()  # Wall-clock stamp for reporting
         
         # Check for connections that should be recycled
         for host in list(self.monitor.connection_stats.keys()):
@@ -260,10 +263,10 @@ class OptimizedConnectionPool:
         # Record connection attempt
         self.monitor.record_connection_attempt(host)
         
-        start_time = time.time()
+        start_time = time.monotonic()
         try:
             async with client.stream(method, url, **kwargs) as response:
-                connection_time = time.time() - start_time
+                connection_time = time.monotonic() - start_time
                 self.monitor.record_connection_success(host, connection_time)
                 yield response
                 
@@ -191,14 +191,14 @@ class EnhancedAudioTranscriber:
                 output_file
             ]
             
-            start_time = time.time()
+            start_time = time.monotonic()
             process = subprocess.run(cmd, capture_output=True, text=True)
             
             if process.returncode != 0:
                 logger.error(f"FFmpeg preprocessing failed: {process.stderr}")
                 return None
             
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             file_size = os.path.getsize(output_file) / (1024 * 1024)
             logger.info(f"Audio preprocessed in {elapsed:.2f}s → {file_size:.1f} MB")
             
@@ -297,7 +297,7 @@ class EnhancedAudioTranscriber:
                 # Apply rate limiting
                 self.rate_limiter.wait_if_needed()
                 
-                start_time = time.time()
+                start_time = time.monotonic()
                 
                 with open(chunk_info["path"], "rb") as audio_file:
                     transcription = self.groq_client.audio.transcriptions.create(
@@ -307,7 +307,7 @@ class EnhancedAudioTranscriber:
                         temperature=0.0
                     )
                 
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 self.rate_limiter.record_success()
                 
                 # Update session metrics
@@ -365,8 +365,8 @@ class EnhancedAudioTranscriber:
     
     def transcribe_audio_enhanced(self, file_path: str, language: str = "en") -> Optional[str]:
         """Enhanced transcription with advanced rate limiting and error handling"""
-        session_start = time.time()
-        self.session_metrics["start_time"] = session_start
+        session_start = time.monotonic()
+        self.session_metrics["start_time"] = time.time()  # Wall-clock stamp for reporting
         
         try:
             logger.info("🚀 Starting enhanced transcription...")
@@ -451,7 +451,7 @@ class EnhancedAudioTranscriber:
                 raise EnhancedTranscriptionError("No successful transcriptions")
             
             # Calculate final metrics
-            total_time = time.time() - session_start
+            total_time = time.monotonic() - session_start
             self.session_metrics["total_processing_time"] = total_time
             
             success_rate = len(transcriptions) / len(chunks) * 100
@@ -159,7 +159,7 @@ class RateLimitingDemo:
         pool = await get_global_pool(GROQ_OPTIMIZED_CONFIG)
         
         # Simulate multiple requests to show connection reuse
-        start_time = time.time()
+        start_time = time.monotonic()
         
         tasks = []
         for i in range(5):
@@ -171,7 +171,7 @@ class RateLimitingDemo:
         
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
         
         # Get pool statistics
         stats = pool.get_stats()
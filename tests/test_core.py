@@ -2,6 +2,8 @@
 import pytest
 import os
 import sys
+import threading
+import time
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -12,8 +14,13 @@ from appStreamlit import (
     sanitize_filename,
     parse_iso8601_duration,
     srt_time_to_seconds,
-    parse_srt_to_segments
+    parse_srt_to_segments,
+    format_segments,
+    ai_transcription_flight,
+    get_ai_transcription_slots,
+    fetch_transcript_segments_cancellable
 )
+from audio_transcriber import transcribe_audio_from_file
 
 
 class TestGetVideoIdFromUrl:
@@ -36,6 +43,12 @@ class TestGetVideoIdFromUrl:
         assert get_video_id_from_url("http://youtu.be/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
         assert get_video_id_from_url("https://youtu.be/dQw4w9WgXcQ?t=42") == "dQw4w9WgXcQ"
     
+    def test_mixed_case_host(self):
+        """Test URLs whose scheme/host use upper or mixed case."""
+        assert get_video_id_from_url("https://www.YouTube.com/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+        assert get_video_id_from_url("HTTPS://WWW.YOUTUBE.COM/watch?v=dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+        assert get_video_id_from_url("https://YOUTU.BE/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
+    
     def test_embed_url(self):
         """Test YouTube embed URLs."""
         assert get_video_id_from_url("https://www.youtube.com/embed/dQw4w9WgXcQ") == "dQw4w9WgXcQ"
@@ -56,6 +69,7 @@ class TestGetVideoIdFromUrl:
         assert get_video_id_from_url("https://www.google.com") is None
         assert get_video_id_from_url("not a url") is None
         assert get_video_id_from_url("https://youtube.com/") is None
+        assert get_video_id_from_url("https://example.com/watch?v=dQw4w9WgXcQ") is None
     
     def test_url_with_whitespace(self):
         """Test URLs with whitespace."""
@@ -216,4 +230,226 @@ Line two"""
         """Test malformed SRT text."""
         srt_text = """This is not valid SRT format"""
         segments = parse_srt_to_segments(srt_text)
-        assert len(segments) == 0  # Should handle gracefully
\ No newline at end of file
+        assert len(segments) == 0  # Should handle gracefully
+
+
+class TestFormatSegments:
+    """Test cases for format_segments function."""
+    
+    SEGMENTS = [
+        {'text': 'Hello', 'start': 1.5, 'duration': 2},
+        {'text': 'World', 'start': 3.5, 'duration': 1},
+    ]
+    
+    def test_txt_format(self):
+        """Test plain text output."""
+        assert format_segments(self.SEGMENTS, "txt") == "Hello World"
+
+    def test_txt_keeps_segment_text_as_is(self):
+        """Test plain text joins segment text without stripping or dropping any."""
+        segments = [
+            {'text': ' Hello ', 'start': 0, 'duration': 1},
+            {'text': '   ', 'start': 1, 'duration': 1},
+            {'start': 2, 'duration': 1},
+            {'text': 'World', 'start': 3, 'duration': 1},
+        ]
+        assert format_segments(segments, "txt") == " Hello " + " " + "   " + " " + "" + " " + "World"
+
+    def test_srt_format(self):
+        """Test SRT output."""
+        expected = (
+            "1\n00:00:01,500 --> 00:00:03,500\nHello\n\n"
+            "2\n00:00:03,500 --> 00:00:04,500\nWorld\n"
+        )
+        assert format_segments(self.SEGMENTS, "srt") == expected
+
+    def test_srt_timestamps_clamp_and_carry(self):
+        """Test overlapping cues are clamped and milliseconds carry into seconds."""
+        segments = [
+            {"text": "A", "start": 3599.999996, "duration": 5.0},
+            {"text": "B", "start": 3601.25, "duration": 1.0},
+        ]
+        expected = (
+            "1\n01:00:00,000 --> 01:00:01,250\nA\n\n"
+            "2\n01:00:01,250 --> 01:00:02,250\nB\n"
+        )
+        assert format_segments(segments, "srt") == expected
+
+    def test_srt_timestamps_round_like_library(self):
+        """Test milliseconds truncate after rounding to 2 decimals, as youtube_transcript_api does."""
+        segments = [{"text": "A", "start": 6016.954995, "duration": 4.147}]
+        assert format_segments(segments, "srt") == "1\n01:40:16,955 --> 01:40:21,101\nA\n"
+
+    def test_vtt_format(self):
+        """Test WebVTT output."""
+        expected = (
+            "WEBVTT\n\n00:00:01.500 --> 00:00:03.500\nHello\n\n"
+            "00:00:03.500 --> 00:00:04.500\nWorld\n"
+        )
+        assert format_segments(self.SEGMENTS, "vtt") == expected
+    
+    def test_json_format(self):
+        """Test JSON output round-trips the segments."""
+        import json
+        assert json.loads(format_segments(self.SEGMENTS, "json")) == self.SEGMENTS
+    
+    def test_unsupported_format(self):
+        """Test unsupported formats."""
+        assert format_segments(self.SEGMENTS, "pdf") == "Unsupported format: pdf"
+    
+    def test_empty_segments(self):
+        """Test empty segment input."""
+        assert format_segments([], "txt") == "No segments provided to format."
+
+
+class TestCancellableTranscriptFetch:
+    """Test cases for fetch_transcript_segments_cancellable."""
+    
+    def test_cancelled_fetch_stops_without_retrying(self):
+        """Test a fetch whose event is already set gives up at once instead of backing off."""
+        cancel_event = threading.Event()
+        cancel_event.set()
+        started = time.monotonic()
+        with pytest.raises(Exception):
+            fetch_transcript_segments_cancellable("dQw4w9WgXcQ", cancel_event)
+        assert time.monotonic() - started < 1
+
+
+class TestAiTranscriptionFlight:
+    """Test cases for ai_transcription_flight single-flight guard."""
+    
+    def test_concurrent_callers_share_one_transcription(self):
+        """Test only one caller transcribes while the others reuse its result."""
+        runs = []
+        results = []
+        
+        def worker():
+            with ai_transcription_flight(("flight_test", "en")) as flight:
+                if not flight['transcript']:
+                    runs.append(1)
+                    time.sleep(0.1)
+                    flight['transcript'] = "shared transcript"
+                results.append(flight['transcript'])
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(runs) == 1
+        assert results == ["shared transcript"] * 4
+    
+    def test_failed_transcription_is_not_shared(self):
+        """Test an empty result is not published to later callers."""
+        with ai_transcription_flight(("flight_test_empty", "en")) as flight:
+            flight['transcript'] = None
+        with ai_transcription_flight(("flight_test_empty", "en")) as flight:
+            assert flight['transcript'] is None
+    
+    def test_waiters_keep_lock_after_failed_run(self):
+        """Test a caller arriving after a failed run queues behind the waiter instead of running alongside it."""
+        active = []
+        peak = []
+        first_inside = threading.Event()
+        
+        def worker(duration, entered=None):
+            with ai_transcription_flight(("flight_test_failed", "en")) as flight:
+                if entered:
+                    entered.set()
+                active.append(1)
+                peak.append(len(active))
+                time.sleep(duration)
+                active.pop()
+                flight['transcript'] = None
+        
+        first = threading.Thread(target=worker, args=(0.2, first_inside))
+        first.start()
+        first_inside.wait()
+        second = threading.Thread(target=worker, args=(0.3,))
+        second.start()
+        time.sleep(0.05)
+        first.join()
+        third = threading.Thread(target=worker, args=(0.1,))
+        third.start()
+        second.join()
+        third.join()
+        
+        assert max(peak) == 1
+    
+    def test_uncacheable_transcription_is_not_shared(self):
+        """Test a result marked uncacheable (e.g. a live stream snapshot) is not published."""
+        with ai_transcription_flight(("flight_test_live", "en")) as flight:
+            flight['transcript'] = "partial live transcript"
+            flight['cacheable'] = False
+        with ai_transcription_flight(("flight_test_live", "en")) as flight:
+            assert flight['transcript'] is None
+    
+    def _hold_slots(self, keys, release):
+        """Start one thread per key that holds an admitted flight until release is set."""
+        entered = []
+        threads = []
+        admitted = []
+        for key in keys:
+            inside = threading.Event()
+            
+            def holder(key=key, inside=inside):
+                with ai_transcription_flight(key) as flight:
+                    admitted.append(flight['admitted'])
+                    inside.set()
+                    release.wait()
+            
+            thread = threading.Thread(target=holder)
+            thread.start()
+            entered.append(inside)
+            threads.append(thread)
+        for inside in entered:
+            inside.wait()
+        assert admitted == [True] * len(keys)
+        return threads
+    
+    def test_caller_over_cap_waits_for_free_slot(self):
+        """Test a caller beyond the concurrency cap is admitted once a slot frees up."""
+        release = threading.Event()
+        holders = self._hold_slots([("cap_test_1", "en"), ("cap_test_2", "en")], release)
+        admitted = []
+        
+        def waiter():
+            with ai_transcription_flight(("cap_test_3", "en")) as flight:
+                admitted.append(flight['admitted'])
+        
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.2)
+        assert admitted == []
+        release.set()
+        thread.join()
+        for holder in holders:
+            holder.join()
+        
+        assert admitted == [True]
+    
+    def test_full_wait_queue_is_turned_away(self):
+        """Test a caller is not admitted when the wait queue is already full."""
+        slots = get_ai_transcription_slots()
+        max_waiting = slots['max_waiting']
+        release = threading.Event()
+        holders = self._hold_slots([("queue_test_1", "en"), ("queue_test_2", "en")], release)
+        try:
+            slots['max_waiting'] = 0
+            with ai_transcription_flight(("queue_test_3", "en")) as flight:
+                assert not flight['admitted']
+        finally:
+            slots['max_waiting'] = max_waiting
+            release.set()
+            for holder in holders:
+                holder.join()
+
+
+class TestTranscribeAudioFromFile:
+    """Test cases for transcribe_audio_from_file as called by the app."""
+    
+    def test_transcriber_accepts_app_call(self):
+        """Test the transcriber accepts the arguments the Groq branch passes it."""
+        assert transcribe_audio_from_file("missing_audio.mp3", language="en",
+                                          progress_callback=lambda *args: None) is None
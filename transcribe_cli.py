@@ -7,9 +7,11 @@ Usage: python transcribe_cli.py <URL_or_FILE> [--output FORMAT] [--provider PROV
 import argparse
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from audio_transcriber import transcribe_audio_from_file
-from appStreamlit import get_video_id_from_url, fetch_transcript_segments, download_audio_as_mp3_enhanced, get_video_info, format_segments
+from appStreamlit import get_video_id_from_url, fetch_transcript_segments_cancellable, download_audio_as_mp3_enhanced, get_video_info, format_segments
 
 
 def transcribe_url(url, output_format="txt", provider="groq"):
@@ -24,21 +26,37 @@ def transcribe_url(url, output_format="txt", provider="groq"):
     
     print(f"📹 Video ID: {video_id}")
     
+    # Try transcript first, overlapping the fetch with the video info lookup
+    print("🔍 Attempting to fetch existing transcript...")
+    executor = ThreadPoolExecutor(max_workers=1)
+    transcript_cancel = threading.Event()
+    transcript_future = executor.submit(fetch_transcript_segments_cancellable, video_id, transcript_cancel)
+    executor.shutdown(wait=False)
+    
     # Get video info
     video_info = get_video_info(video_id)
     print(f"📝 Title: {video_info['title']}")
     print(f"⏱️  Duration: {video_info['duration']} seconds")
     
-    # Try transcript first
-    try:
-        print("🔍 Attempting to fetch existing transcript...")
-        segments, language, error = fetch_transcript_segments(video_id)
-        if segments:
-            print(f"✅ Found transcript in {language}")
-            formatted_text = format_segments(segments, output_format)
-            return formatted_text
-    except Exception as e:
-        print(f"⚠️ Transcript fetch failed: {e}")
+    live_status = video_info.get('live_status', 'none')
+    if live_status == 'is_upcoming':
+        transcript_cancel.set()
+        print("❌ Error: This stream hasn't started yet")
+        return None
+    
+    if live_status == 'is_live':
+        # No transcript exists until the stream ends; go straight to audio
+        transcript_cancel.set()
+        print("🔴 Live stream detected, skipping transcript lookup")
+    else:
+        try:
+            segments, language, error = transcript_future.result()
+            if segments:
+                print(f"✅ Found transcript in {language}")
+                formatted_text = format_segments(segments, output_format)
+                return formatted_text
+        except Exception as e:
+            print(f"⚠️ Transcript fetch failed: {e}")
     
     # Fallback to audio transcription
     print("🎵 Downloading audio for transcription...")
@@ -55,7 +73,8 @@ def transcribe_url(url, output_format="txt", provider="groq"):
     audio_path = download_audio_as_mp3_enhanced(
         video_id, 
         video_title=video_info.get('title'),
-        status_placeholder=status
+        status_placeholder=status,
+        video_info=video_info
     )
     
     if not audio_path:
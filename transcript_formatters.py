@@ -0,0 +1,97 @@
+"""
+Transcript segment formatters for ytFetch
+Pure, fully typed helpers with no Streamlit dependency, so the hot formatting
+loops can be imported by the CLI and compiled (e.g. with mypyc) unchanged.
+"""
+
+import json
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+orjson: Optional[ModuleType]
+try:
+    import orjson  # Optional: much faster JSON encoding for long transcripts
+except ImportError:
+    orjson = None
+
+
+def _cue_timestamp(seconds: float, ms_separator: str) -> str:
+    """Format seconds as an HH:MM:SS<sep>mmm cue timestamp, rounding like youtube_transcript_api."""
+    seconds = float(seconds)
+    whole_seconds = int(seconds)
+    millis = int(round((seconds - whole_seconds) * 1000, 2))
+    # The library prints ',1000' here; carry into the seconds instead
+    if millis == 1000:
+        whole_seconds += 1
+        millis = 0
+    hours, remainder = divmod(whole_seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{ms_separator}{millis:03d}"
+
+
+def _format_cues(segments: Sequence[Any], ms_separator: str, numbered: bool) -> str:
+    """Build SRT/WebVTT cue blocks, clamping each cue's end to the next cue's start."""
+    fields: List[Tuple[float, float, str]] = []
+    append_fields = fields.append
+    for segment in segments:
+        if isinstance(segment, dict):
+            append_fields((segment.get('start', 0), segment.get('duration', 0), segment.get('text', '')))
+        else:
+            append_fields((segment.start, segment.duration, segment.text))
+
+    last_index = len(fields) - 1
+    cues: List[str] = []
+    append_cue = cues.append
+    for i, (start, duration, text) in enumerate(fields):
+        end = start + duration
+        if i < last_index and fields[i + 1][0] < end:
+            end = fields[i + 1][0]
+        time_text = f"{_cue_timestamp(start, ms_separator)} --> {_cue_timestamp(end, ms_separator)}"
+        append_cue(f"{i + 1}\n{time_text}\n{text}" if numbered else f"{time_text}\n{text}")
+    return "\n\n".join(cues) + "\n"
+
+
+def format_srt(segments: Sequence[Any]) -> str:
+    """Format segments as SubRip (SRT) subtitles."""
+    return _format_cues(segments, ',', numbered=True)
+
+
+def format_vtt(segments: Sequence[Any]) -> str:
+    """Format segments as WebVTT subtitles."""
+    return "WEBVTT\n\n" + _format_cues(segments, '.', numbered=False)
+
+
+def format_json(segments: Sequence[Any]) -> str:
+    """Format segments as indented JSON."""
+    # For JSON, we can use the original dict format
+    if orjson is not None:
+        encoded: bytes = orjson.dumps(segments, option=orjson.OPT_INDENT_2)
+        return encoded.decode('utf-8')
+    return json.dumps(segments, indent=2, ensure_ascii=False)
+
+
+def format_txt(segments: Sequence[Any]) -> str:
+    """Format segments as a single line of plain text."""
+    text_parts: List[str] = []
+    append = text_parts.append  # Bound once: skips the method lookup per segment
+    for segment in segments:
+        append(segment.get('text', '') if isinstance(segment, dict) else getattr(segment, 'text', ''))
+    return ' '.join(text_parts)
+
+
+# Built once; filled per download with a single str.format call
+VIDEO_HEADER_TEMPLATE = "Video Title: {title}\nYouTube URL: {url}\nVideo ID: {video_id}\n" + "-" * 80 + "\n\n"
+
+
+def format_video_header(title: str, url: str, video_id: str) -> str:
+    """Build the title/URL/ID header prepended to saved transcripts."""
+    return VIDEO_HEADER_TEMPLATE.format(title=title, url=url, video_id=video_id)
+
+
+# Output format -> (progress label, formatter), resolved with a single dict lookup
+SEGMENT_FORMATTERS: Dict[str, Tuple[str, Callable[[Sequence[Any]], str]]] = {
+    "txt": ("plain text", format_txt),
+    "srt": ("SRT", format_srt),
+    "vtt": ("WebVTT", format_vtt),
+    "json": ("JSON", format_json),
+}